@@ -0,0 +1,14 @@
+import os
+
+# /events keeps one response open per admin tab (up to SSE_MAX_SECONDS), so
+# requests run on threads: a sync worker would be tied up by a single stream.
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+threads = int(os.environ.get("GUNICORN_THREADS", "32"))
+# app.py caps open streams per worker at SSE_MAX_STREAMS (default: half of these threads)
+# repository.py sizes each worker's connection pool to these threads (DB_POOL_MAX);
+# a smaller pool makes requests wait up to DB_POOL_WAIT_SECONDS for a connection
+
+# gthread workers heartbeat independently of requests, so long streams are not killed
+timeout = 30
+graceful_timeout = 30
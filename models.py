@@ -0,0 +1,48 @@
+from collections import namedtuple
+
+
+class Record:
+    """Mixin for the tuple-backed row types below.
+
+    Instances are plain tuples (no per-row dict), built straight from cursor
+    rows. `columns` lists the database column behind each field, in field
+    order; it only differs from `_fields` where a column is a Python keyword.
+    """
+    __slots__ = ()
+    columns = ()
+
+    @classmethod
+    def from_cursor(cls, cursor):
+        """Fetches every row of the cursor's last query as records. The
+        column-to-field mapping is resolved once per query, not per row."""
+        rows = cursor.fetchall()
+        selected = tuple(col.name for col in cursor.description)
+        if selected == cls.columns:
+            return list(map(cls._make, rows))
+        # Fields the query didn't select take their default (None unless given)
+        positions = [selected.index(col) if col in selected else None for col in cls.columns]
+        defaults = [cls._field_defaults[field] for field in cls._fields]
+        return [cls._make([d if i is None else row[i] for i, d in zip(positions, defaults)]) for row in rows]
+
+
+def _record(name, columns, extra_fields=None):
+    """Builds a Record type whose field names follow the columns ('class' -> 'class_').
+    extra_fields maps fields filled in by the caller, not a column, to their defaults."""
+    extra_fields = extra_fields or {}
+    fields = tuple('class_' if col == 'class' else col for col in columns) + tuple(extra_fields)
+    base = namedtuple(name, fields, defaults=(None,) * len(columns) + tuple(extra_fields.values()))
+    return type(name, (Record, base), {'__slots__': (), 'columns': tuple(columns) + tuple(extra_fields)})
+
+
+Student = _record('Student', ('id', 'name', 'gender', 'class', 'grade', 'password', 'phone'))
+
+Teacher = _record('Teacher', ('id', 'name', 'gender', 'phone', 'password', 'subjects'))
+
+Subject = _record('Subject', ('subject_id', 'name', 'teacher_id', 'teacher_name', 'student_count'),
+                  extra_fields={'enrolled_students': ()})
+
+# schedules_table.id is the teacher's ID and .name the teacher's name
+Schedule = _record('Schedule', ('schedule_id', 'id', 'name', 'terms', 'subject', 'day', 'time_start', 'time_end'))
+
+Fee = _record('Fee', ('fee_id', 'student_id', 'subject_id', 'amount', 'paid', 'status', 'due_date',
+                      'subject_name', 'teacher_name'))
@@ -0,0 +1,104 @@
+#!/usr/bin/env bash
+# Local primary + streaming replica for trying DATABASE_REPLICA_URLS.
+#
+#   scripts/local_replica.sh start    initdb a primary, clone a replica with
+#                                     pg_basebackup -R, start both, init_db.py
+#   scripts/local_replica.sh pause    pause WAL replay on the replica (simulated lag)
+#   scripts/local_replica.sh resume   resume WAL replay
+#   scripts/local_replica.sh disconnect  stop the replica's WAL receiver (replication cut)
+#   scripts/local_replica.sh reconnect   restore its primary_conninfo
+#   scripts/local_replica.sh status   receiver state and how far replay trails the primary
+#   scripts/local_replica.sh stop     stop both servers
+#
+# Run as a non-root user with the PostgreSQL binaries on PATH (or set PG_BIN).
+# Then run the app with the URLs printed by `start`:
+#
+#   export DATABASE_URL=postgresql://postgres@127.0.0.1:5433/daa
+#   export DATABASE_REPLICA_URLS=postgresql://postgres@127.0.0.1:5434/daa
+#   export DB_REPLICA_CHECK_SECONDS=2
+#
+# Expected behaviour:
+#   - /manage_students and /manage_teachers read from the replica (the replica
+#     log shows the EXECUTEs with log_statement=all); every POST goes to the primary.
+#   - After a POST the same session reads from the primary for READ_YOUR_WRITES_SECONDS.
+#   - `pause`, then write on the primary (e.g. add a student): once the lag passes
+#     DB_REPLICA_MAX_LAG_SECONDS (5s) the next health check logs "lagging ... reading
+#     from primary" and listings come from the primary. `resume` brings it back.
+#   - `disconnect`: the next health check logs "is not streaming from the primary"
+#     and listings come from the primary, even though the replica has nothing
+#     left to replay. `reconnect` brings it back.
+#   - `pg_ctl stop` on the replica: the health check fails, reads go to the
+#     primary within DB_REPLICA_CHECK_SECONDS; a read already sent to the replica
+#     is retried on the primary.
+set -euo pipefail
+
+BASE_DIR=${BASE_DIR:-/tmp/daa_replica}
+PRIMARY_PORT=${PRIMARY_PORT:-5433}
+REPLICA_PORT=${REPLICA_PORT:-5434}
+DB_NAME=${DB_NAME:-daa}
+BIN=${PG_BIN:+$PG_BIN/}
+
+replica_sql() {
+    "${BIN}psql" -h 127.0.0.1 -p "$REPLICA_PORT" -U postgres -d "$DB_NAME" -Atc "$1"
+}
+
+primary_sql() {
+    "${BIN}psql" -h 127.0.0.1 -p "$PRIMARY_PORT" -U postgres -d "$DB_NAME" -Atc "$1"
+}
+
+case "${1:-}" in
+start)
+    mkdir -p "$BASE_DIR"
+    "${BIN}initdb" -D "$BASE_DIR/primary" -U postgres -A trust >/dev/null
+    "${BIN}pg_ctl" -D "$BASE_DIR/primary" -l "$BASE_DIR/primary.log" -w \
+        -o "-p $PRIMARY_PORT -k $BASE_DIR -c log_statement=all" start
+    "${BIN}createdb" -h 127.0.0.1 -p "$PRIMARY_PORT" -U postgres "$DB_NAME"
+
+    # -R writes standby.signal and primary_conninfo, making this a streaming replica
+    "${BIN}pg_basebackup" -h 127.0.0.1 -p "$PRIMARY_PORT" -U postgres -D "$BASE_DIR/replica" -R
+    "${BIN}pg_ctl" -D "$BASE_DIR/replica" -l "$BASE_DIR/replica.log" -w \
+        -o "-p $REPLICA_PORT -k $BASE_DIR -c log_statement=all" start
+
+    DATABASE_URL="postgresql://postgres@127.0.0.1:$PRIMARY_PORT/$DB_NAME" \
+        python "$(dirname "$0")/../init_db.py"
+    echo
+    echo "export DATABASE_URL=postgresql://postgres@127.0.0.1:$PRIMARY_PORT/$DB_NAME"
+    echo "export DATABASE_REPLICA_URLS=postgresql://postgres@127.0.0.1:$REPLICA_PORT/$DB_NAME"
+    ;;
+pause)
+    replica_sql "SELECT pg_wal_replay_pause()" >/dev/null
+    echo "replay paused; writes on the primary now build up lag"
+    ;;
+resume)
+    replica_sql "SELECT pg_wal_replay_resume()" >/dev/null
+    echo "replay resumed"
+    ;;
+disconnect)
+    # Saved so reconnect can restore the setting pg_basebackup -R wrote
+    replica_sql "SHOW primary_conninfo" > "$BASE_DIR/primary_conninfo"
+    replica_sql "ALTER SYSTEM SET primary_conninfo = ''" >/dev/null
+    replica_sql "SELECT pg_reload_conf()" >/dev/null
+    echo "WAL receiver stopped; writes on the primary no longer reach the replica"
+    ;;
+reconnect)
+    conninfo=$(sed "s/'/''/g" "$BASE_DIR/primary_conninfo")
+    replica_sql "ALTER SYSTEM SET primary_conninfo = '$conninfo'" >/dev/null
+    replica_sql "SELECT pg_reload_conf()" >/dev/null
+    echo "WAL receiver restarting"
+    ;;
+status)
+    # Same comparison as the app's health check: replay position against the primary's
+    primary_lsn=$(primary_sql "SELECT pg_current_wal_lsn()")
+    replica_sql "SELECT COALESCE((SELECT status FROM pg_stat_wal_receiver), 'stopped') AS receiver,
+            pg_wal_lsn_diff('$primary_lsn', pg_last_wal_replay_lsn()) AS bytes_behind,
+            pg_is_wal_replay_paused() AS paused"
+    ;;
+stop)
+    "${BIN}pg_ctl" -D "$BASE_DIR/replica" -m fast stop || true
+    "${BIN}pg_ctl" -D "$BASE_DIR/primary" -m fast stop || true
+    ;;
+*)
+    echo "usage: $0 start|pause|resume|disconnect|reconnect|status|stop" >&2
+    exit 1
+    ;;
+esac
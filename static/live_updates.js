@@ -0,0 +1,113 @@
+// Live dashboard updates: patches listing pages in place from the /events
+// Server-Sent Events stream instead of reloading the whole page.
+//
+// Markup contract:
+//   <tbody data-live-table="student_data">        container of rows for one table
+//     <tr data-id="12">                           one item per primary key
+//       <td data-field="name">...</td>            text replaced with row[field]
+//
+// Optional container attributes:
+//   data-live-where="student_id=5"    only rows whose field equals the value belong here
+//   data-live-search="ann"            case-insensitive substring filter (like ILIKE)
+//   data-live-search-field="name"     field the search applies to (default "name")
+//   data-live-insert="reload"         reload the page for new rows instead of cloning;
+//                                     needed when rows show joined data the NOTIFY row lacks
+//
+// New rows are cloned from an existing one, so every per-row value in a cloned
+// container must carry data-field or be read from the row at use time.
+//
+// Optional field attributes:
+//   data-format="money|upper|initials"
+//   data-class-prefix="status-"       also sets class "<prefix><value>" on the element
+(function(){
+  function display(value, format){
+    if (value === null || value === undefined || value === '') return '—';
+    if (format === 'money') return '$' + Number(value).toFixed(2);
+    if (format === 'upper') return String(value).toUpperCase();
+    if (format === 'initials') return String(value).slice(0, 2).toUpperCase();
+    return String(value);
+  }
+
+  function belongs(container, row){
+    const where = container.dataset.liveWhere;
+    if (where) {
+      const i = where.indexOf('=');
+      if (String(row[where.slice(0, i)]) !== where.slice(i + 1)) return false;
+    }
+    const search = (container.dataset.liveSearch || '').toLowerCase();
+    if (search) {
+      const field = container.dataset.liveSearchField || 'name';
+      if (String(row[field] || '').toLowerCase().indexOf(search) === -1) return false;
+    }
+    return true;
+  }
+
+  function patch(item, row){
+    item.querySelectorAll('[data-field]').forEach(el => {
+      const value = row[el.dataset.field];
+      el.textContent = display(value, el.dataset.format);
+      const prefix = el.dataset.classPrefix;
+      if (prefix) {
+        el.classList.forEach(c => { if (c.indexOf(prefix) === 0) el.classList.remove(c); });
+        el.classList.add(prefix + value);
+      }
+    });
+  }
+
+  function insert(container, pk, row){
+    const template = container.querySelector('[data-id]');
+    if (!template || container.dataset.liveInsert === 'reload') return false;
+    const item = template.cloneNode(true);
+    const oldId = template.dataset.id;
+    const pattern = new RegExp('/' + oldId + '(?=$|[/?#])');
+    item.dataset.id = pk;
+    item.querySelectorAll('[href],[action]').forEach(el => {
+      ['href', 'action'].forEach(attr => {
+        if (el.hasAttribute(attr)) el.setAttribute(attr, el.getAttribute(attr).replace(pattern, '/' + pk));
+      });
+    });
+    patch(item, row);
+    container.appendChild(item);
+    return true;
+  }
+
+  function apply(container, evt){
+    const item = container.querySelector('[data-id="' + evt.pk + '"]');
+    if (evt.op === 'delete' || !belongs(container, evt.row)) {
+      if (item) item.remove();
+      return true;
+    }
+    if (item) {
+      patch(item, evt.row);
+      return true;
+    }
+    return insert(container, evt.pk, evt.row);
+  }
+
+  // derive: optional {table: fn(row)} adding computed fields (e.g. remaining balance)
+  // onChange: optional callback run after each applied event
+  function watch(url, options){
+    if (!window.EventSource) return;
+    options = options || {};
+    const derive = options.derive || {};
+    const containers = Array.from(document.querySelectorAll('[data-live-table]'));
+    const tables = Array.from(new Set(containers.map(c => c.dataset.liveTable)));
+    if (!tables.length) return;
+
+    const source = new EventSource(url + '?tables=' + encodeURIComponent(tables.join(',')));
+    source.addEventListener('change', e => {
+      const evt = JSON.parse(e.data);
+      if (evt.row && derive[evt.table]) derive[evt.table](evt.row);
+      let applied = true;
+      containers.forEach(c => {
+        if (c.dataset.liveTable === evt.table) applied = apply(c, evt) && applied;
+      });
+      // Nothing to clone from (e.g. an empty listing): fall back to a full reload
+      if (!applied) { window.location.reload(); return; }
+      if (options.onChange) options.onChange(evt);
+    });
+    source.addEventListener('resync', () => window.location.reload());
+  }
+
+  window.LiveUpdates = { watch: watch };
+})();